@@ -500,14 +500,41 @@ class Component(ABC):
         rsq = dx**2 + dy**2
         return sqrt(rsq)
 
+    @cached_property
+    def select_path(self):
+        """Region, in component coordinates, used for selection.  This
+        does not depend on the node positions so is never cleared."""
+
+        return array(self.bbox_path) * 0.7
+
     def is_within_bbox(self, x, y):
-        tf = self.tf.inverted()
 
-        xb, yb = tf.transform((x, y))
+        xb, yb = self.inverse_tf.transform((x, y))
 
-        path = array(self.bbox_path) * 0.7
+        return point_in_polygon(xb, yb, self.select_path)
 
-        return point_in_polygon(xb, yb, path)
+    @cached_property
+    def bbox(self):
+        """Return the axis-aligned bounding box (xmin, ymin, xmax, ymax)
+        enclosing the region tested by `is_within_bbox`.  This is used
+        as a cheap rejection test so subclasses that override
+        `is_within_bbox` must also override this."""
+
+        path = self.tf.transform(self.select_path)
+        xmin, ymin = path.min(axis=0)
+        xmax, ymax = path.max(axis=0)
+        return xmin, ymin, xmax, ymax
+
+    @cached_property
+    def pins_bbox(self):
+        """Return the axis-aligned bounding box (xmin, ymin, xmax, ymax)
+        of the transformed pins.  This is used as a cheap rejection
+        test when searching for pins."""
+
+        xy = array([pin.xy for pin in self.transformed_pins])
+        xmin, ymin = xy.min(axis=0)
+        xmax, ymax = xy.max(axis=0)
+        return xmin, ymin, xmax, ymax
 
     def netitem_nodes(self, node_names):
         parts = []
@@ -574,12 +601,20 @@ class Component(ABC):
         return self.make_tf(self.node1.pos, self.node2.pos,
                             self.pos1, self.pos2)
 
+    @cached_property
+    def inverse_tf(self):
+        return self.tf.inverted()
+
     def _clear_caches(self):
 
         try:
             del self.tf
         except AttributeError:
             pass
+        try:
+            del self.inverse_tf
+        except AttributeError:
+            pass
         try:
             del self.relative_pins
         except AttributeError:
@@ -588,6 +623,14 @@ class Component(ABC):
             del self.transformed_pins
         except AttributeError:
             pass
+        try:
+            del self.bbox
+        except AttributeError:
+            pass
+        try:
+            del self.pins_bbox
+        except AttributeError:
+            pass
 
     def undraw(self):
 
@@ -626,9 +669,13 @@ class Component(ABC):
     @cached_property
     def transformed_pins(self):
 
+        pins = list(self.relative_pins)
+
+        # Transform all the pin positions with a single call.
+        positions = self.tf.transform([pin.xy for pin in pins])
+
         newpins = Pins()
-        for pin in self.relative_pins:
-            x, y = self.tf.transform(pin.xy)
+        for pin, (x, y) in zip(pins, positions):
             newpins.add(Pin(pin.name, pin.loc, x, y, pin.isnode))
 
         return newpins
@@ -3,6 +3,7 @@ from ..core.picture import Picture
 from ..core.tf import TF
 from math import cos, sin, radians, sqrt
 from numpy import array
+from lcapy.cache import cached_property
 
 
 class Connection(Bipole):
@@ -152,6 +153,13 @@ class Connection(Bipole):
         r = sqrt((x - xm)**2 + (y - ym)**2)
         return r < 0.5
 
+    @cached_property
+    def bbox(self):
+
+        xm = self.midpoint.x
+        ym = self.midpoint.y
+        return xm - 0.5, ym - 0.5, xm + 0.5, ym + 0.5
+
     def choose_node_name(self, m, nodes):
 
         if m == 0 and self.symbol_kind in ('vcc', 'vdd'):
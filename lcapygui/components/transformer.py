@@ -1,6 +1,7 @@
 from .fixed import Fixed
 
 from numpy import array
+from lcapy.cache import cached_property
 
 
 # TODO: make stretchy
@@ -62,6 +63,17 @@ class Transformer(Fixed):
         # TODO: perhaps select input or output pair of nodes
         return x > -w / 2 and x < w / 2 and y > -h / 2 and y < h / 2
 
+    @cached_property
+    def bbox(self):
+
+        w = abs(self.nodes[2].x - self.nodes[0].x)
+        h = abs(self.nodes[0].y - self.nodes[1].y)
+
+        midpoint = self.midpoint
+
+        return (midpoint.x - w / 2, midpoint.y - h / 2,
+                midpoint.x + w / 2, midpoint.y + h / 2)
+
     @property
     def sketch_net(self):
 
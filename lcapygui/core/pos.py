@@ -1,13 +1,12 @@
 from math import sqrt
 from copy import copy
+from numpy import array, ndarray
 
 
 class Pos(object):
 
     def __init__(self, x, y=0):
 
-        from numpy import ndarray
-
         if isinstance(x, tuple):
             x, y = x
         elif isinstance(x, ndarray):
@@ -52,8 +51,6 @@ class Pos(object):
     @property
     def xy(self):
 
-        from numpy import array
-
         return array((self.x, self.y))
 
     def norm(self):
@@ -1,8 +1,10 @@
 from lcapy import Circuit
+from lcapy.cache import cached_property
 from .tf import TF
 from .svgparse import SVGParse
 from os.path import join
 from matplotlib.path import Path
+from numpy import isin
 from warnings import warn
 
 
@@ -19,6 +21,15 @@ class SketchPath:
 
         return self.symbol or ('fill' in self.style and self.style['fill'] != 'none')
 
+    @cached_property
+    def flipped_path(self):
+        """Path with y inverted.  The SVG coordinate system has y going
+        down the screen but Matplotlib's coordinate system has y going
+        up the screen.  This is cached since the sketches are shared and
+        it is needed every time a component is drawn."""
+
+        return Path(self.path.vertices * (1, -1), self.path.codes)
+
     def transform(self, transform):
 
         path = self.path.transformed(transform)
@@ -306,16 +317,17 @@ class Sketch:
         ymax = -1000
         for spath in self.paths:
             path = spath.path
-            for v, c in zip(path.vertices, path.codes):
-                if c in (Path.MOVETO, Path.LINETO):
-                    pos = v
-                    if pos[0] > xmax:
-                        xmax = pos[0]
-                    if pos[0] < xmin:
-                        xmin = pos[0]
-                    if pos[1] > ymax:
-                        ymax = pos[1]
-                    if pos[1] < ymin:
-                        ymin = pos[1]
+            # Ignore the control points of curves.
+            vertices = path.vertices[isin(path.codes,
+                                          (Path.MOVETO, Path.LINETO))]
+            if len(vertices) == 0:
+                continue
+
+            vmin = vertices.min(axis=0)
+            vmax = vertices.max(axis=0)
+            xmin = min(xmin, vmin[0])
+            ymin = min(ymin, vmin[1])
+            xmax = max(xmax, vmax[0])
+            ymax = max(ymax, vmax[1])
 
         return xmin, xmax, ymin, ymax
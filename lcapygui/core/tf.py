@@ -20,14 +20,26 @@ class TF(Affine2D):
         x0, y0 = xpos1
         x1, y1 = xpos2
 
-        A = array(((x0, y0, 1, 0), (y0, -x0, 0, 1),
-                   (x1, y1, 1, 0), (y1, -x1, 0, 1)))
-
-        u = array((u0, v0, u1, v1))
-
-        m = dot(pinv(A), u)
-
-        H = array(((m[0], m[1], m[2]), (-m[1], m[0], m[3]), (0, 0, 1)))
+        dx = x1 - x0
+        dy = y1 - y0
+        rsq = dx**2 + dy**2
+
+        if rsq != 0:
+            # Solve the 4x4 system directly; this is called for every
+            # component whenever its nodes change.
+            du = u1 - u0
+            dv = v1 - v0
+            a = (du * dx + dv * dy) / rsq
+            b = (du * dy - dv * dx) / rsq
+            m = (a, b, u0 - a * x0 - b * y0, v0 - a * y0 + b * x0)
+        else:
+            # Degenerate case; use least squares solution.
+            A = array(((x0, y0, 1, 0), (y0, -x0, 0, 1),
+                       (x1, y1, 1, 0), (y1, -x1, 0, 1)))
+
+            u = array((u0, v0, u1, v1))
+
+            m = dot(pinv(A), u)
 
         obj = cls.from_values(m[0], -m[1], m[1], m[0], m[2], m[3])
         # Hack since Affine2D hardwires class
@@ -1,5 +1,9 @@
 class Action:
 
+    # Actions are kept in the undo and redo buffers so avoid
+    # a per-instance dict.
+    __slots__ = ('cpt', 'from_nodes', 'to_nodes')
+
     def __init__(self, cpt, from_nodes=None, to_nodes=None):
 
         self.cpt = cpt
@@ -9,21 +13,24 @@ class Action:
     def __str__(self):
 
         if self.from_nodes is None or self.to_nodes is None:
-            return '%s %s' % (self.code, self.cpt)
+            return f'{self.code} {self.cpt}'
 
-        return '%s %s %s -> %s' % (self.code, self.cpt,
-                                   list(self.from_nodes),
-                                   list(self.to_nodes))
+        return (f'{self.code} {self.cpt} {list(self.from_nodes)} -> '
+                f'{list(self.to_nodes)}')
 
 
 class ActionAdd(Action):
 
+    __slots__ = ()
+
     code = 'A'
     inverse_code = 'D'
 
 
 class ActionDelete(Action):
 
+    __slots__ = ()
+
     code = 'D'
     inverse_code = 'A'
 
@@ -31,5 +38,7 @@ class ActionDelete(Action):
 class ActionMove(Action):
     # Detach, move, attach
 
+    __slots__ = ()
+
     code = 'M'
     inverse_code = 'M'
@@ -69,12 +69,11 @@ class CrossHair:
 
             # Draw cursor
             self.picture.add(
-                sketcher.stroke_line(
-                    self.x, self.y - 0.5 * scale, self.x, self.y + 0.5 * scale,
-                    linewidth=line_width, color=line_color))
-            self.picture.add(
-                sketcher.stroke_line(
-                    self.x - 0.5 * scale, self.y, self.x + 0.5 * scale, self.y,
+                sketcher.stroke_lines(
+                    ((self.x, self.y - 0.5 * scale,
+                      self.x, self.y + 0.5 * scale),
+                     (self.x - 0.5 * scale, self.y,
+                      self.x + 0.5 * scale, self.y)),
                     linewidth=line_width, color=line_color))
 
         elif self.style == 'node':
@@ -103,20 +102,15 @@ class CrossHair:
 
             # Draw cursor
             self.picture.add(
-                sketcher.stroke_line(
-                    self.x, self.y + 0.2 * scale, self.x, self.y + 0.5 * scale,
-                    linewidth=line_width, color=line_color))
-            self.picture.add(
-                sketcher.stroke_line(
-                    self.x, self.y - 0.5 * scale, self.x, self.y - 0.2 * scale,
-                    linewidth=line_width, color=line_color))
-            self.picture.add(
-                sketcher.stroke_line(
-                    self.x + 0.2 * scale, self.y, self.x + 0.5 * scale, self.y,
-                    linewidth=line_width, color=line_color))
-            self.picture.add(
-                sketcher.stroke_line(
-                    self.x - 0.5 * scale, self.y, self.x - 0.2 * scale, self.y,
+                sketcher.stroke_lines(
+                    ((self.x, self.y + 0.2 * scale,
+                      self.x, self.y + 0.5 * scale),
+                     (self.x, self.y - 0.5 * scale,
+                      self.x, self.y - 0.2 * scale),
+                     (self.x + 0.2 * scale, self.y,
+                      self.x + 0.5 * scale, self.y),
+                     (self.x - 0.5 * scale, self.y,
+                      self.x - 0.2 * scale, self.y)),
                     linewidth=line_width, color=line_color))
 
 
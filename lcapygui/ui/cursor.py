@@ -30,21 +30,16 @@ class Cursor:
             alpha=0.5
         ))
 
-        self.picture.add(self.sketcher.stroke_line(
-            self.x - radius, self.y,
-            self.x + radius, self.y,
+        segments = [(self.x - radius, self.y, self.x + radius, self.y)]
+        if polarity == 'positive':
+            segments.append((self.x, self.y - radius, self.x, self.y + radius))
+
+        self.picture.add(self.sketcher.stroke_lines(
+            segments,
             color=self.line_colour,
             linewidth=1.5
         ))
 
-        if polarity == 'positive':
-            self.picture.add(self.sketcher.stroke_line(
-                self.x, self.y - radius,
-                self.x, self.y + radius,
-                color=self.line_colour,
-                linewidth=1.5
-            ))
-
     def remove(self):
         if self.picture is not None:
             self.picture.remove()
@@ -96,39 +96,21 @@ class PreferencesDialog(Window):
 
     def on_update(self, arg=None):
 
-        self.model.preferences.label_nodes = self.labelentries.get(
-            'label_nodes')
-        self.model.preferences.draw_nodes = self.labelentries.get('draw_nodes')
-        self.model.preferences.label_style = self.labelentries.get(
-            'label_style')
-        self.model.preferences.style = self.labelentries.get('style')
-        self.model.preferences.voltage_dir = self.labelentries.get(
-            'voltage_dir')
-        self.model.preferences.grid = self.labelentries.get('grid')
-        self.model.preferences.line_width = self.labelentries.get('line_width')
-        self.model.preferences.font_size = self.labelentries.get('font_size')
-        self.model.preferences.scale = self.labelentries.get('scale')
-        self.model.preferences.node_size = self.labelentries.get('node_size')
-        self.model.preferences.show_units = self.labelentries.get('show_units')
-        self.model.preferences.xsize = self.labelentries.get('xsize')
-        self.model.preferences.ysize = self.labelentries.get('ysize')
-        self.model.preferences.snap_grid = self.labelentries.get('snap_grid')
-        self.model.preferences.current_sign_convention = self.labelentries.get(
-            'current_sign_convention')
-        self.model.preferences.line_width_scale = self.labelentries.get(
-            'line_width_scale')
-        self.model.preferences.cpt_size = self.labelentries.get(
-            'cpt_size')
-        self.model.preferences.grid_spacing = self.labelentries.get(
-            'grid_spacing')
-        self.model.preferences.color_scheme = self.labelentries.get(
-            'color_scheme')
+        preferences = self.model.preferences
+
+        changed = False
+        for name in self.labelentries:
+            value = self.labelentries.get(name)
+            if value != getattr(preferences, name):
+                setattr(preferences, name, value)
+                changed = True
 
         # Do not set show_units; this needs fixing in Lcapy since
         # str(expr) includes the units and this causes problems...
 
-        if self.update:
-            # Could check for changes
+        # Only redraw if something has changed since this is called
+        # for every selection and every return key press.
+        if self.update and changed:
             self.update()
 
     def on_ok(self):
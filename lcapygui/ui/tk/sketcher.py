@@ -1,7 +1,7 @@
 from matplotlib.patches import PathPatch, Arc, Circle, Polygon
 from matplotlib.path import Path
 from math import degrees
-from numpy import array
+from numpy import array, nan
 
 
 class Sketcher:
@@ -32,16 +32,16 @@ class Sketcher:
         patches = []
 
         for m, spath in enumerate(sketch.paths):
-            path = spath.path
             fill = spath.fill
 
             # Note, the SVG coordinate system has y going down the screen
             # but Matplotlib's coordinate system has y going up the screen.
             # Thus we need to invert the sense of mirror.
 
-            if not mirror:
-                vertices = path.vertices * (1, -1)
-                path = Path(vertices, path.codes)
+            if mirror:
+                path = spath.path
+            else:
+                path = spath.flipped_path
             if invert:
                 vertices = path.vertices * (-1, 1)
                 path = Path(vertices, path.codes)
@@ -66,6 +66,19 @@ class Sketcher:
         return self.ax.plot((xstart, xend), (ystart, yend),
                             color=color, **kwargs)
 
+    def stroke_lines(self, segments, color='black', **kwargs):
+        """Draw line segments ((xstart, ystart, xend, yend), ...) as a
+        single artist.  The segments are separated by NaNs so that they
+        are not joined."""
+
+        xvals = []
+        yvals = []
+        for xstart, ystart, xend, yend in segments:
+            xvals.extend((xstart, xend, nan))
+            yvals.extend((ystart, yend, nan))
+
+        return self.ax.plot(xvals, yvals, color=color, **kwargs)
+
     def stroke_arc(self, x, y, r, theta1, theta2, **kwargs):
 
         r *= 2
@@ -80,12 +93,9 @@ class Sketcher:
         xend = xstart + width
         yend = ystart + height
 
-        lines = []
-        lines.append(self.stroke_line(xstart, ystart, xstart, yend, **kwargs))
-        lines.append(self.stroke_line(xstart, yend, xend, yend, **kwargs))
-        lines.append(self.stroke_line(xend, yend, xend, ystart, **kwargs))
-        lines.append(self.stroke_line(xend, ystart, xstart, ystart, **kwargs))
-        return lines
+        path = ((xstart, ystart), (xstart, yend), (xend, yend),
+                (xend, ystart))
+        return self.stroke_path(path, closed=True, **kwargs)
 
     def stroke_filled_circle(self, x, y, radius=0.5, color='black',
                              alpha=0.5, **kwargs):
@@ -125,18 +135,13 @@ class Sketcher:
 
     def stroke_path(self, path, color='black', closed=False, **kwargs):
 
-        lines = []
-        for m in range(len(path) - 1):
-            xstart, ystart = path[m]
-            xend, yend = path[m + 1]
-
-            lines.append(self.stroke_line(xstart, ystart,
-                         xend, yend, color=color, **kwargs))
+        xvals = [point[0] for point in path]
+        yvals = [point[1] for point in path]
         if closed:
-            xstart, ystart = path[0]
-            lines.append(self.stroke_line(xstart, ystart,
-                         xend, yend, color=color, **kwargs))
-        return lines
+            xvals.append(xvals[0])
+            yvals.append(yvals[0])
+
+        return self.ax.plot(xvals, yvals, color=color, **kwargs)
 
     def text(self, x, y, text, ha='center', va='center', **kwargs):
 
@@ -130,6 +130,7 @@ class UIModelBase:
         self.mouse_position = (0, 0)
         self.dragged = False
         self.zoom_factor = 1
+        self.label_cache = {}
 
     @property
     def node_spacing(self):
@@ -303,8 +304,12 @@ class UIModelBase:
 
         """
 
-        if type(ignore) == Node:
-            ignore = [ignore]
+        # Use an empty tuple rather than None so that only one
+        # check is needed for each node.
+        if ignore is None:
+            ignore = ()
+        elif type(ignore) == Node:
+            ignore = (ignore, )
 
         for node in self.circuit.nodes.values():
             if node.pos is None:
@@ -312,7 +317,7 @@ class UIModelBase:
                 # reference pin.
                 warn('Ignoring node %s with no position' % node.name)
                 continue
-            elif ignore is not None and node in ignore:
+            elif node in ignore:
                 if self.ui.debug:
                     print('Ignoring node %s' % node.name)
                 continue
@@ -334,17 +339,31 @@ class UIModelBase:
             y position
         """
 
+        # Rather than returning the first pin within range, return the
+        # nearest so that the result does not depend on the order
+        # of the components when pins are close together.
+        closest_cpt, closest_pin = None, None
+        rsq_min = 0.1
+        r = sqrt(rsq_min)
+
         for cpt in self.circuit.elements.values():
             gcpt = cpt.gcpt
             if gcpt is None:
                 continue
 
+            # Skip components with all their pins out of range.
+            xmin, ymin, xmax, ymax = gcpt.pins_bbox
+            if (x < xmin - r or x > xmax + r or
+                    y < ymin - r or y > ymax + r):
+                continue
+
             for pin in gcpt.transformed_pins:
-                x1, y1 = pin.pos.x, pin.pos.y
+                x1, y1 = pin.x, pin.y
                 rsq = (x1 - x) ** 2 + (y1 - y) ** 2
-                if rsq < 0.1:
-                    return cpt, pin
-        return None, None
+                if rsq < rsq_min:
+                    closest_cpt, closest_pin = cpt, pin
+                    rsq_min = rsq
+        return closest_cpt, closest_pin
 
     def copy(self, cpt):
 
@@ -440,7 +459,7 @@ class UIModelBase:
         # else:
         #     value_latex = '$' + expr(value).latex() + '$'
 
-        name, value = LabelMaker().make(cpt, label_ports=True)
+        name, value = self.cpt_labels(cpt)
 
         label = ''
         alabel = ''
@@ -551,6 +570,20 @@ class UIModelBase:
                 'Cannot find a component with nodes %s and %s' % (node_name1, node_name2))
         return fcpt
 
+    def cpt_labels(self, cpt):
+        """Return the name and value labels for a component.  These
+        are cached since they are needed for every redraw and
+        creating them requires parsing the component value."""
+
+        key = (cpt.type, cpt.id, cpt.classname,
+               tuple(str(arg) for arg in cpt.args))
+
+        labels = self.label_cache.get(key)
+        if labels is None:
+            labels = LabelMaker().make(cpt, label_ports=True)
+            self.label_cache[key] = labels
+        return labels
+
     def cpt_move(self, cpt, xshift, yshift, move_nodes=False):
 
         if self.ui.debug:
@@ -567,8 +600,19 @@ class UIModelBase:
             # or if we wish to move all the components sharing the
             # a node with the selected component, we can just move the nodes
 
+            # Move all the nodes before redrawing so that each
+            # connected component is only redrawn once.
+            cpts = {}
             for node in cpt.nodes:
-                self.node_move(node, node.pos.x + xshift, node.pos.y + yshift)
+                node.pos.x += xshift
+                node.pos.y += yshift
+                for cpt1 in node.connected:
+                    cpts[cpt1.name] = cpt1
+
+            if self.ui.debug:
+                print('Redrawing', ', '.join(cpts))
+
+            self.cpts_redraw(cpts.values())
 
         else:
             # Alternatively, we need to detach the component and
@@ -605,10 +649,7 @@ class UIModelBase:
             print('Moving node', node.name, 'to', node.pos)
 
         # Update connected components
-        for cpt in node.connected:
-            gcpt = cpt.gcpt
-            gcpt.undraw()
-            gcpt.draw(self, color=self.preferences.color('line'))
+        self.cpts_redraw(node.connected)
 
     def node_join(self, from_node, to_node=None):
         """
@@ -701,6 +742,24 @@ class UIModelBase:
         newcpt.opts.clear()
         newcpt.opts.add(gcpt._attr_string(newcpt.tf))
 
+    def cpts_redraw(self, cpts):
+        """
+        Redraws the given components, for example, after their nodes
+        have been moved
+
+        Parameters
+        ==========
+        cpts : iterable of lcapy.mnacpts.Cpt
+            The components to redraw
+        """
+
+        color = self.preferences.color('line')
+
+        for cpt in cpts:
+            gcpt = cpt.gcpt
+            gcpt.undraw()
+            gcpt.draw(self, color=color)
+
     def cpt_remake(self, cpt):
 
         # This is called when the control component of a dependent source
@@ -1287,6 +1346,13 @@ class UIModelBase:
         v1_x, v1_y = gcpt.node1.x, gcpt.node1.y
         v2_x, v2_y = gcpt.node2.x, gcpt.node2.y
 
+        # Most components are horizontal or vertical and for these
+        # the projection is trivial.
+        if v1_y == v2_y:
+            return x, v1_y
+        if v1_x == v2_x:
+            return v1_x, y
+
         # Convert line to a vector relative to node1
         cpt_vect = array([v2_x - v1_x, v2_y - v1_y])
         # Convert point x,y to a vector relative to node1
@@ -1354,6 +1420,12 @@ class UIModelBase:
 
     def node_find(self, nodename):
 
+        # The nodes are keyed by name so try a direct lookup first.
+        node = self.circuit.nodes.get(nodename)
+        if node is not None and node.name == nodename:
+            return node
+
+        # Fall back to a search in case a node has been renamed.
         for node in self.circuit.nodes.values():
             if node.name == nodename:
                 return node
@@ -14,6 +14,7 @@ from .cursor import Cursor
 from .cursors import Cursors
 from .highlight import Highlight
 from ..core.picture import Picture
+from ..core.cpt_maker import gcpt_make_from_type
 from .action import ActionAdd, ActionDelete, ActionMove
 from .uimodelbase import UIModelBase
 
@@ -175,6 +176,33 @@ class UIModelDnD(UIModelBase):
         self.ui.refresh()
         return True if len(self.cursors) == 2 else False
 
+    def sketch_preload(self, thing):
+        """
+        Loads the sketch for a component type into the sketch library.
+
+        Parameters
+        ----------
+        thing
+            The type of component to be placed
+
+        Notes
+        -----
+        Sketches are loaded lazily from SVG files.  This is called when a
+        component type is chosen so that the file is parsed before the
+        first drag rather than pausing the drag while it is placed.
+
+        """
+
+        kind = '-' + thing.kind if thing.kind != '' else ''
+
+        try:
+            gcpt = gcpt_make_from_type(thing.cpt_type, kind=kind)
+            self.ui.sketchlib.lookup(gcpt.sketch_key, self.preferences.style)
+        except (ValueError, FileNotFoundError):
+            # An unsupported component or missing sketch will be
+            # reported when the component is created.
+            pass
+
     def snap_align_cursor(self, x, y):
 
         if len(self.cursors) < 1:
@@ -284,6 +312,12 @@ class UIModelDnD(UIModelBase):
             if gcpt is None:
                 continue
 
+            # Cheap rejection test before transforming the point
+            # into the component's coordinates.
+            xmin, ymin, xmax, ymax = gcpt.bbox
+            if x < xmin or x > xmax or y < ymin or y > ymax:
+                continue
+
             if gcpt.is_within_bbox(x, y):
                 return cpt
 
@@ -542,6 +576,7 @@ class UIModelDnD(UIModelBase):
             if self.ui.debug:
                 print(f'Crosshair mode: {self.crosshair.thing}')
             self.crosshair.update(thing=thing)
+            self.sketch_preload(thing)
 
     def on_add_con(self, thing):
         """